@@ -12,10 +12,9 @@ con.useGreeting('./greeting.txt')
 con.attach('name', Name())
 
 
-@con.register('q')
-@con.register('quit')
-def stop(*a, **kw):
-    name = con.getObject('name')
+@con.register('q', inject='name')
+@con.register('quit', inject='name')
+def stop(name, *a, **kw):
     if name.value:
         con.display(f'Goodbye, {name.value}!')
     else:
@@ -35,15 +34,13 @@ def listCommands(*a, **kw):
     )
 
 
-@con.register('ask')
-def askName(*a, **kw):
-    name = con.getObject('name')
+@con.register('ask', inject='name')
+def askName(name, *a, **kw):
     name.value = input('What is your name?\n')
 
 
-@con.register('greet')
-def sayHello(*a, **kw):
-    name = con.getObject('name')
+@con.register('greet', inject='name')
+def sayHello(name, *a, **kw):
     if name.value:
         con.display(f'Hello, {name.value}!')
         return
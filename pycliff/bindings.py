@@ -1,4 +1,6 @@
 #!/usr/bin/python
+import sys
+from functools import partial
 
 
 class CommandBindingException(Exception):
@@ -12,10 +14,14 @@ class Bindings(object):
         only be bound to a single handler.
     """
 
+    __slots__ = ('_commands', '_default', '_args', '_args_offset', '_sorted')
+
     def __init__(self):
         self._commands = {}
         self._default = None
-        self._args = []
+        self._args = ()
+        self._args_offset = 0
+        self._sorted = None
 
     def __contains__(self, key: str) -> bool:
         """ Enable the 'in' keyword to be used with a Binding object.
@@ -32,12 +38,16 @@ class Bindings(object):
 
     @property
     def argc(self):
-        return len(self._args)
+        return len(self._args) - self._args_offset
 
     def getArg(self, index, default=''):
         if (index >= self.argc):
             return default
-        return self._args[index]
+        if (index < 0):
+            index += self.argc
+            if (index < 0):
+                raise IndexError('argument index out of range')
+        return self._args[index + self._args_offset]
 
     def add(self, command: str, handler: callable) -> callable:
         """ Add a handler and its associated command to this binding.
@@ -52,8 +62,15 @@ class Bindings(object):
             Returns:
                 handler: callable
                     This is the handler provided in the function params
+
+            Raises:
+                CommandBindingException:
+                    When the handler is not a callable
         """
-        self._commands[command] = handler
+        if not callable(handler):
+            raise CommandBindingException(f'{command}: handler is not callable')
+        self._commands[sys.intern(command)] = handler
+        self._sorted = None
         return handler
 
     def setDefault(self, handler: callable) -> callable:
@@ -64,7 +81,13 @@ class Bindings(object):
             Returns:
                 handler: callable
                     The default handler itself
+
+            Raises:
+                CommandBindingException:
+                    When the handler is neither a callable nor None
         """
+        if handler is not None and not callable(handler):
+            raise CommandBindingException('default handler is not callable')
         self._default = handler
         return handler
 
@@ -76,9 +99,7 @@ class Bindings(object):
                 command: str
                     The command that will invoke the handler
         """
-        def decorator(handler: callable):
-            return self.add(command, handler)
-        return decorator
+        return partial(self.add, command)
 
     def asList(self) -> int:
         """ Returns a list of all commands registered to this binding.
@@ -86,7 +107,9 @@ class Bindings(object):
                 commands: str
                     A list of all commands registered to this binding.
         """
-        return sorted(self._commands.keys())
+        if self._sorted is None:
+            self._sorted = sorted(self._commands.keys())
+        return list(self._sorted)
 
     def execute(self, *commands: str):
         """ Executes a registered handler that matches the given command.
@@ -99,12 +122,23 @@ class Bindings(object):
 
             Raises:
                 CommandBindingException:
-                    When the handler is not a callable
+                    When the command is not recognized and there
+                    is no default handler
         """
         if (len(commands) == 0):
             return
-        command, self._args = commands[0], commands[1:]
-        handler = self._commands.get(command, self._default)
-        if not callable(handler):
-            raise CommandBindingException(f'{command}: command not recognized')
-        return handler(*self._args)
+        # Keep the full tuple and skip the command name by offset
+        # rather than copying the arguments into a new tuple.
+        command, self._args, self._args_offset = commands[0], commands, 1
+        # Handlers are checked for callability when they are bound,
+        # so only the missing-command path needs a check here.
+        handler = self._commands.get(command)
+        if handler is None:
+            handler = self._default
+            if handler is None:
+                raise CommandBindingException(f'{command}: command not recognized')
+        # Calling with no arguments is equivalent to unpacking an empty
+        # tuple for any handler, so no signature inspection is needed.
+        if (len(commands) == 1):
+            return handler()
+        return handler(*commands[1:])
@@ -1,14 +1,108 @@
 #!/usr/bin/python3
-import shlex
-from typing import List
+from __future__ import annotations
+import os
+import sys
+from functools import partial
 from .bindings import Bindings, CommandBindingException
 
+# Characters that str.split() cannot handle the way shlex does: quotes,
+# escapes, and the whitespace besides ' \t\r\n' that str.split() splits
+# on but shlex keeps as token text.
+_SHLEX_CHARS = frozenset(
+    '"\'\\'
+    '\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+
+# Greeting file (mtime, contents), keyed by absolute path.
+_GREETING_CACHE: dict[str, tuple[int, str]] = {}
+
+# Compiled on first use by _split_quoted() to keep re off the import path.
+_QUOTED_PIECE_RE = None
+_DQUOTED_ESCAPE_RE = None
+_QUOTED_PIECE_PATTERN = r'''
+      (?P<space>[ \t\r\n]+)
+    | (?P<word>[^ \t\r\n'"\\]+)
+    | \\(?P<escaped>.)
+    | '(?P<squoted>[^']*)'
+    | "(?P<dquoted>(?:[^"\\]|\\.)*)"
+'''
+
+
+def _split_quoted(command: str) -> list[str]:
+    """ Split a command containing quotes or escapes the same way
+        shlex.split() does, using a precompiled regular expression
+        instead of shlex's character-by-character state machine.
+
+        Raises:
+            ValueError:
+                When a quote is left unclosed or the command ends with
+                an unescaped backslash, with the same messages as shlex
+    """
+    global _QUOTED_PIECE_RE, _DQUOTED_ESCAPE_RE
+    if _QUOTED_PIECE_RE is None:
+        import re
+        _QUOTED_PIECE_RE = re.compile(_QUOTED_PIECE_PATTERN, re.S | re.X)
+        # Inside double quotes only \" and \\ are escapes.
+        _DQUOTED_ESCAPE_RE = re.compile(r'\\(["\\])')
+
+    tokens = []
+    token = None
+    pos, end = 0, len(command)
+    while pos < end:
+        match = _QUOTED_PIECE_RE.match(command, pos)
+        if match is None:
+            # Outside single quotes, an odd run of trailing backslashes
+            # leaves the last one with nothing to escape.
+            rest = command[pos:]
+            trailing = len(rest) - len(rest.rstrip('\\'))
+            if rest[0] != "'" and trailing % 2:
+                raise ValueError('No escaped character')
+            raise ValueError('No closing quotation')
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == 'space':
+            if token is not None:
+                tokens.append(token)
+                token = None
+            continue
+        piece = match.group(kind)
+        if kind == 'dquoted' and '\\' in piece:
+            piece = _DQUOTED_ESCAPE_RE.sub(r'\1', piece)
+        token = piece if token is None else token + piece
+    if token is not None:
+        tokens.append(token)
+    return tokens
+
+
+def _fast_input(prompt: str) -> str:
+    """ A lighter replacement for input() used when stdin is not
+        a terminal. It writes and flushes the prompt once and reads
+        a line straight from sys.stdin.
+
+        Raises:
+            EOFError:
+                When stdin has reached end of file
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
 
 class Console(object):
     """ Top level console object. This object sets up the console
         and loops to take user inputs as commands and execute them.
     """
 
+    __slots__ = (
+        '_running', '_bindings', '_objects',
+        '_prompt', '_greeting',
+    )
+
     def __init__(self, prompt='>', greeting=''):
         """Args:
                 prompt: str
@@ -47,19 +141,27 @@ class Console(object):
         self._greeting = greeting
 
     def useGreeting(self, filename: str) -> None:
-        """ Instruct the console to use a greeting stored in a text file
+        """ Instruct the console to use a greeting stored in a text file.
+            The contents are cached and only re-read when the file's
+            modification time changes.
+
             Args:
                 filename: str
                     Path to the text file containing the greeting
         """
-        with open(filename, 'r') as gfile:
-            greeting = gfile.read()
-            self._greeting = greeting
+        path = os.path.abspath(filename)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _GREETING_CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'r') as gfile:
+                cached = (mtime, gfile.read())
+            _GREETING_CACHE[path] = cached
+        self._greeting = cached[1]
 
-    def commandList(self) -> List[str]:
+    def commandList(self) -> list[str]:
         """ Returns a list of all commands bound to this console
             Returns:
-                commands: List[str]
+                commands: list[str]
                     A list of command strings bound to this console
         """
         return self._bindings.asList()
@@ -70,18 +172,23 @@ class Console(object):
                 messages: str
                     Messages to display to the console
         """
-        for message in messages:
-            print(message)
+        if messages:
+            sys.stdout.write('\n'.join(map(str, messages)))
+            sys.stdout.write('\n')
 
-    def register(self, command: str) -> callable:
+    def register(self, command: str, inject: str = None) -> callable:
         """ A decorator to bind a command handler to this console instance
             Args:
                 command: str
                     Command string to invoke the decorated command handler
+                inject: str
+                    Key of an attached object to pass to the handler as its
+                    first argument. The object is looked up once, when the
+                    handler is registered, so it must be attached beforehand.
         """
-        def decorator(handler: callable):
-            return self._bindings.add(command, handler)
-        return decorator
+        if inject is None:
+            return partial(self._bindings.add, command)
+        return partial(self._register_injected, command, inject)
 
     def default(self, handler: callable) -> callable:
         """ A decorator to bind a default handler to this console instance
@@ -100,10 +207,12 @@ class Console(object):
         if self._greeting:
             self.display(self._greeting)
 
+        # Keep input() on a terminal so readline line editing still works.
+        read = input if sys.stdin.isatty() else _fast_input
         self._running = True
         try:
             while (self._running):
-                response = input(self._prompt)
+                response = read(self._prompt)
                 self._process_command(response)
         except KeyboardInterrupt:
             self.display('', 'Exiting...')
@@ -111,7 +220,8 @@ class Console(object):
     def execute(self, filename: str) -> None:
         """ Executes a script file instead of launching the console
             interactively. The script execution can be terminated
-            early with CTRL+C.
+            early with CTRL+C. Blank lines and lines starting with
+            '#' are skipped.
 
             Args:
                 filename: str
@@ -121,9 +231,17 @@ class Console(object):
             self.display(self._greeting)
 
         try:
+            # Read the whole script at once; text mode has already
+            # normalized line endings to '\n'.
             with open(filename, 'r') as script:
-                for command in script:
-                    self._process_command(command)
+                lines = script.read().split('\n')
+            for command in lines:
+                # Only test the stripped line; stripping it could drop
+                # an escaped trailing space or change token text.
+                stripped = command.strip()
+                if not stripped or stripped.startswith('#'):
+                    continue
+                self._process_command(command)
         except (IOError, OSError) as e:
             self.display('An error occurred while opening script file')
         except KeyboardInterrupt:
@@ -161,11 +279,27 @@ class Console(object):
         """
         return self._objects.get(key, default)
 
+    def _register_injected(self, command: str, key: str,
+                           handler: callable) -> callable:
+        """ Internal helper method to bind a handler with an attached
+            object pre-bound as its first argument.
+        """
+        try:
+            obj = self._objects[key]
+        except KeyError:
+            raise CommandBindingException(
+                f'{command}: no object attached as {key!r}') from None
+        self._bindings.add(command, partial(handler, obj))
+        return handler
+
     def _process_command(self, command: str) -> None:
         """ Internal helper method to parse and execute a command string.
         """
-        command = shlex.split(command)
+        if _SHLEX_CHARS.isdisjoint(command):
+            tokens = command.split()
+        else:
+            tokens = _split_quoted(command)
         try:
-            self._bindings.execute(*command)
+            self._bindings.execute(*tokens)
         except CommandBindingException as e:
             self.display(e)
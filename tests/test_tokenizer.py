@@ -0,0 +1,59 @@
+import shlex
+import unittest
+
+from pycliff.console import _split_quoted
+
+
+class SplitQuotedTest(unittest.TestCase):
+    """ _split_quoted() must tokenize exactly like shlex.split(). """
+
+    CASES = [
+        'say "hello world" foo',
+        "say 'hello world' foo",
+        'a"b c"d',
+        "a'b c'd",
+        'x "a""b"',
+        "a '' b",
+        'a "" b',
+        '""',
+        'a\\ b c',
+        'a \\"b\\" c',
+        'a "b \\" c"',
+        'a "b \\\\ c"',
+        'a "b \\n c"',
+        "a 'b \\ c'",
+        'a\\\\b',
+        '  a\t"b"\r\n c  ',
+        'a "b\nc"',
+        'a\xa0b "c"',
+        'a\u3000"b c"',
+    ]
+
+    ERRORS = [
+        'a "b',
+        "a 'b",
+        "a 'b\\",
+        'a "b\\"',
+        'a "b\\',
+        'a "b\\\\',
+        'a\\',
+        'a "b" c\\',
+    ]
+
+    def test_matches_shlex(self):
+        for command in self.CASES:
+            with self.subTest(command=command):
+                self.assertEqual(_split_quoted(command), shlex.split(command))
+
+    def test_error_messages_match_shlex(self):
+        for command in self.ERRORS:
+            with self.subTest(command=command):
+                with self.assertRaises(ValueError) as expected:
+                    shlex.split(command)
+                with self.assertRaises(ValueError) as actual:
+                    _split_quoted(command)
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()